@@ -4,7 +4,6 @@ from rest_framework_simplejwt.views import TokenObtainPairView
 class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
     @classmethod
     def get_token(cls, user):
-        print(f"---/\/\/\/\===>{user}")
         token = super().get_token(user)
 
         # Add custom claims
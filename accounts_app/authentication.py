@@ -0,0 +1,28 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from helper.user_cache import get_cached_user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that keeps the token's user in Django's cache,
+    so authenticated requests skip the per-request user SELECT.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            # Let simplejwt raise its usual InvalidToken error
+            return super().get_user(validated_token)
+        load_user = super().get_user
+        user = get_cached_user(user_id, lambda: load_user(validated_token))
+        # Cache hits skip simplejwt's own checks, so repeat the revoke check here
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+        return user
@@ -0,0 +1,36 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+
+class UsernameOrEmailBackend(ModelBackend):
+    """ModelBackend that accepts either the username or the email as ``username``
+    (case-insensitive), resolving the user with one query in the common case.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        UserModel = get_user_model()
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        users = self._candidates(UserModel, username)
+        if len(users) != 1:
+            # Hash anyway so a missing user takes as long as a wrong password
+            UserModel().set_password(password)
+            return None
+        user = users[0]
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    def _candidates(self, UserModel, identifier):
+        """Return at most two users matching ``identifier``; two means ambiguous.
+        An identifier containing '@' is matched against email first, so a username
+        that looks like someone else's email cannot shadow that user's email login.
+        """
+        manager = UserModel._default_manager
+        if "@" in identifier:
+            users = list(manager.filter(email__iexact=identifier)[:2])
+            if users:
+                return users
+        return list(manager.filter(username__iexact=identifier)[:2])
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from accounts_app.tasks import purge_pending_deletions
+
+
+class Command(BaseCommand):
+    help = "Delete every user whose deletion was requested but not yet carried out."
+
+    def handle(self, *args, **options):
+        deleted = purge_pending_deletions()
+        self.stdout.write(f"{deleted} rows removed.")
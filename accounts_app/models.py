@@ -38,6 +38,8 @@ class User(AbstractUser):
         decimal_places=2,
         default=0
     )
+    # Set when the user asks to be deleted; the row is removed by a background job
+    deletion_requested_at = models.DateTimeField(null=True, blank=True)
     objects = UserManager()
     REQUIRED_FIELDS = ["email","birthdate", "phonenumber"]
 
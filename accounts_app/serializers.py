@@ -1,12 +1,60 @@
 # serializers.py
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import router, transaction
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 from .models import User  # keep it relative
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView
 
-class UserSerializer(serializers.ModelSerializer):
-    password = serializers.CharField(write_only=True, min_length=8)
+class UserListSerializer(serializers.ListSerializer):
+    """Validates and creates a batch of users as a whole. Uniqueness against
+    existing rows is left to the database: conflicting rows are skipped on
+    insert, so retrying a batch is safe.
+    """
+    unique_fields = ("username", "email")
+    # Rows per INSERT statement
+    batch_size = 1000
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The unique constraints decide on insert, so drop the per-row UniqueValidator queries
+        for name in self.unique_fields:
+            field = self.child.fields[name]
+            field.validators = [v for v in field.validators if not isinstance(v, UniqueValidator)]
+
+    def validate(self, attrs):
+        # Duplicates inside one batch are a client error; no query needed
+        errors = {}
+        for name in self.unique_fields:
+            seen, repeated = set(), set()
+            for row in attrs:
+                if row[name] in seen:
+                    repeated.add(row[name])
+                seen.add(row[name])
+            if repeated:
+                errors[name] = [f"Repeated in batch: {', '.join(sorted(repeated))}"]
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
 
+    def create(self, validated_data):
+        passwords = [data.pop("password") for data in validated_data]
+        users = [User(**data) for data in validated_data]
+        # Password hashers spend their time in C code that releases the GIL,
+        # so a thread pool hashes the batch in parallel. Each Argon2 hash holds
+        # ~100 MiB, hence a small fixed pool (settings.PASSWORD_HASH_WORKERS).
+        with ThreadPoolExecutor(max_workers=max(1, min(len(users), settings.PASSWORD_HASH_WORKERS))) as pool:
+            for user, hashed in zip(users, pool.map(make_password, passwords)):
+                user.password = hashed
+        # One transaction for the whole batch, on the database the router writes users to
+        with transaction.atomic(using=router.db_for_write(User)):
+            # ON CONFLICT DO NOTHING: rows clashing with existing usernames/emails are skipped
+            return User.objects.bulk_create(users, batch_size=self.batch_size, ignore_conflicts=True)
+
+class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         # include only fields you want to accept on create
@@ -15,6 +63,13 @@ class UserSerializer(serializers.ModelSerializer):
             "first_name", "last_name",
             "birthdate", "nationalid", "phonenumber"
         ]
+        # Let ModelSerializer build password from the model field instead of declaring it
+        extra_kwargs = {"password": {"write_only": True, "min_length": 8}}
+        list_serializer_class = UserListSerializer
+
+    # Field names never change at runtime, so keep them on the class instead
+    # of instantiating a serializer (and deep-copying its fields) to list them.
+    FIELD_NAMES = tuple(Meta.fields)
 
     def create(self, validated_data):
         password = validated_data.pop("password")
@@ -26,12 +81,15 @@ class UserSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         # If password is provided, hash and update it
         password = validated_data.pop("password", None)
-        if password:
-            instance.set_password(password)
-        # Update other fields that were passed in validated_data
+        # validated_data only holds Meta.fields the client sent
+        changed = list(validated_data)
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        if password:
+            instance.set_password(password)
+            changed.append("password")
+        # Only write the columns the client actually sent
+        instance.save(update_fields=changed)
         return instance
         
 
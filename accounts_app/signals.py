@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from helper.user_cache import invalidate_cached_user
+from .models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def drop_cached_user(sender, instance, **kwargs):
+    """Keep the authentication cache in step with every save/delete of a user
+    (API, admin, forms). Note: queryset.update() sends no signal; invalidate by hand there.
+    """
+    invalidate_cached_user(instance.pk)
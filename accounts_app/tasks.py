@@ -0,0 +1,34 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.db import connections
+from helper.logger_setup import setup_logger
+from .models import User
+
+logger = setup_logger('accounts_app')
+# One worker: deletions run one at a time, off the request thread
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="accounts_tasks")
+
+
+def purge_pending_deletions(**filters) -> int:
+    """Delete users marked with ``deletion_requested_at`` (narrowed by ``filters``).
+    Returns the number of rows removed, cascades included.
+    """
+    # The collector only needs the primary key to cascade; don't load the whole row
+    deleted, _ = User.objects.filter(deletion_requested_at__isnull=False, **filters).only("pk").delete()
+    return deleted
+
+
+def _delete_user(user_id):
+    try:
+        deleted = purge_pending_deletions(pk=user_id)
+        logger.info("User %s purged (%d rows removed).", user_id, deleted)
+    except Exception:
+        # The user stays marked; `manage.py purge_deleted_users` retries it
+        logger.exception("Background delete of user %s failed", user_id)
+    finally:
+        # Connections are per thread; don't leave this worker's open
+        connections.close_all()
+
+
+def delete_user_task(user_id):
+    """Queue the cascading delete of ``user_id`` and return immediately."""
+    _executor.submit(_delete_user, user_id)
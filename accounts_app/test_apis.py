@@ -9,6 +9,16 @@ def access_token_fulluser():
     response_json=response.json().get('data')
     return response_json['access']
 
+@pytest.fixture
+def access_token_staff():
+    # Staff account for the admin-only endpoints; create it once with
+    # `python manage.py createsuperuser` (username: staff, password: staff_secret@w0rld)
+    data={'username_or_email':'staff','password':'staff_secret@w0rld'}
+    url='http://127.0.0.1:8000/api/requesttoken/'
+    response=requests.post(url,data=data)
+    response_json=response.json().get('data')
+    return response_json['access']
+
 def test_create_user():
     url = "http://127.0.0.1:8000/api/createuser/"
     payload = {
@@ -32,6 +42,81 @@ def test_token():
 
 
 
+def test_bulk_create_users_requires_admin(access_token_fulluser):
+    url = "http://127.0.0.1:8000/api/createusers/"
+    payload = [
+        {
+            "username": "bulk_user_0",
+            "email": "bulk_user_0@example.com",
+            "password": "hidden_secret@w0rld",
+            "birthdate": "1992-01-27",
+            "phonenumber": "+49 15259027585"
+        }
+    ]
+    response=requests.post(url,json=payload)
+    assert response.status_code==401
+    headers={"Authorization": f"Bearer {access_token_fulluser}"}
+    response=requests.post(url,headers=headers,json=payload)
+    assert response.status_code==403
+
+def test_bulk_create_users(access_token_staff):
+    url = "http://127.0.0.1:8000/api/createusers/"
+    headers={"Authorization": f"Bearer {access_token_staff}"}
+    payload = [
+        {
+            "username": f"bulk_user_{i}",
+            "email": f"bulk_user_{i}@example.com",
+            "password": "hidden_secret@w0rld",
+            "birthdate": "1992-01-27",
+            "phonenumber": "+49 15259027585"
+        }
+        for i in range(3)
+    ]
+    response=requests.post(url,headers=headers,json=payload)
+    assert response.status_code==200
+    assert response.json()['data']['submitted']==3
+    # Sending the same batch again skips the existing rows instead of failing
+    response=requests.post(url,headers=headers,json=payload)
+    assert response.status_code==200
+
+def test_bulk_create_users_rejects_invalid_batches(access_token_staff):
+    url = "http://127.0.0.1:8000/api/createusers/"
+    headers={"Authorization": f"Bearer {access_token_staff}"}
+    row = {
+        "username": "bulk_dup",
+        "email": "bulk_dup@example.com",
+        "password": "hidden_secret@w0rld",
+        "birthdate": "1992-01-27",
+        "phonenumber": "+49 15259027585"
+    }
+    response=requests.post(url,headers=headers,json=[row,dict(row,email="bulk_dup2@example.com")])
+    assert response.status_code==400
+    too_many=[dict(row,username=f"bulk_max_{i}",email=f"bulk_max_{i}@example.com") for i in range(1001)]
+    response=requests.post(url,headers=headers,json=too_many)
+    assert response.status_code==400
+
+def test_token_email_not_shadowed_by_username():
+    create_url = "http://127.0.0.1:8000/api/createuser/"
+    victim = {
+        "username": "victim",
+        "email": "victim@example.com",
+        "password": "victim_secret@w0rld",
+        "phonenumber": "+49 15259027586"
+    }
+    # Someone else registers the victim's email as their username
+    squatter = {
+        "username": "victim@example.com",
+        "email": "squatter@example.com",
+        "password": "squatter_secret@w0rld",
+        "phonenumber": "+49 15259027587"
+    }
+    assert requests.post(create_url,data=victim).status_code==201
+    assert requests.post(create_url,data=squatter).status_code==201
+    url='http://127.0.0.1:8000/api/requesttoken/'
+    payload={"username_or_email":"victim@example.com","password":"victim_secret@w0rld"}
+    response=requests.post(url,data=payload)
+    assert response.status_code==200
+
 def test_update_user(access_token_fulluser):
     url = "http://127.0.0.1:8000/api/updateuser/"
     headers={"Authorization": f"Bearer {access_token_fulluser}"}
@@ -45,4 +130,4 @@ def test_delete_user(access_token_fulluser):
     url = "http://127.0.0.1:8000/api/deleteuser/"
     headers={"Authorization": f"Bearer {access_token_fulluser}"}
     response=requests.delete(url,headers=headers)
-    assert response.status_code==200
+    assert response.status_code==202
@@ -11,6 +11,7 @@ urlpatterns = [
     path('logout/',views.logout_view,name='logout'),
     path('create_view/',views.create_view,name='create_view'),
     path("api/createuser/", views.UserCreateView.as_view(), name="createuser"),
+    path("api/createusers/", views.BulkCreateUserAPI.as_view(), name="createusers"),
     path('api/deleteuser/', views.DeleteUserAPI.as_view(), name='deleteuser'),
     path('api/updateuser/', views.UpdateUserAPI.as_view(), name='updateuser'),
     path('api/requesttoken/', views.RequestTokenAPI.as_view(), name='requesttoken'),
@@ -1,12 +1,15 @@
 from django.shortcuts import render, HttpResponse, redirect
 from django.http import JsonResponse
 from django.contrib.auth import authenticate, login, logout
-from helper.Get_Username_Object import UserFetcher
 from .forms import CreateUser, AuthenticationForm
+from .models import User
+from .tasks import delete_user_task
 from helper.logger_setup import setup_logger
+from helper.user_cache import invalidate_cached_user
 from django.contrib import messages
+from django.utils import timezone
 from .serializers import UserSerializer, LoginSerializer
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
@@ -15,7 +18,12 @@ from django.utils.decorators import method_decorator
 from django_ratelimit.decorators import ratelimit
 
 logger = setup_logger('accounts_app')
-get_user_parameters = UserFetcher()
+# UserCreateView.get always answers the same thing, so build the body once
+_CREATE_USER_GET_PAYLOAD = {
+    "success": True,
+    "message": "This endpoint creates users (POST only).",
+    "data": {"fields_required": list(UserSerializer.FIELD_NAMES)},
+}
 
 # ---------- Helpers ----------
 
@@ -38,15 +46,16 @@ def login_view(request):
     if request.method == "POST":
         form = AuthenticationForm(request.POST)
         if form.is_valid():
-            username, password = get_user_parameters.get_user_from_form(form)
-            if username is None:
-                messages.error(request, "This user does not exist. Please register first.")
-                return render(request, 'login.html', {'form': form})
-            user = authenticate(request, username=username, password=password)
+            # UsernameOrEmailBackend resolves the user and checks the password in one step
+            user = authenticate(
+                request,
+                username=form.cleaned_data["username_or_email"],
+                password=form.cleaned_data["password"],
+            )
             if user:
                 login(request, user)
                 return redirect('/home')
-            messages.error(request, "The password is not valid.")
+            messages.error(request, "Invalid username/email or password.")
             return render(request, 'login.html', {'form': form})
         messages.error(request, "Invalid form. Please contact the administrator.")
         return render(request, 'login.html', {'form': form})
@@ -88,7 +97,7 @@ class UserCreateView(APIView):
             return fail("Invalid data.", errors=serializer.errors, http_status=status.HTTP_400_BAD_REQUEST)
         try:
             user = serializer.save()
-            logger.info(f'User {user.username} created successfully')
+            logger.info('User %s created successfully', user.username)
             safe = {
                 "id": user.id,
                 "username": user.username,
@@ -102,12 +111,31 @@ class UserCreateView(APIView):
             return fail("Failed to create user.", http_status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     def get(self, request):
-        serializer = UserSerializer()
-        return ok(
-            "This endpoint creates users (POST only).",
-            data={"fields_required": list(serializer.fields.keys())},
-            http_status=status.HTTP_200_OK
-        )
+        return Response(_CREATE_USER_GET_PAYLOAD, status=status.HTTP_200_OK)
+
+@ratelimit_5pm
+class BulkCreateUserAPI(APIView):
+    # Bulk import is an admin tool: every row costs a password hash
+    permission_classes = [IsAdminUser]
+    # Largest list accepted in one request; longer (or empty) lists get a 400
+    max_users = 1000
+
+    def post(self, request):
+        serializer = UserSerializer(data=request.data, many=True, allow_empty=False, max_length=self.max_users)
+        if not serializer.is_valid():
+            return fail("Invalid data.", errors=serializer.errors, http_status=status.HTTP_400_BAD_REQUEST)
+        try:
+            users = serializer.save()
+            logger.info('Bulk batch of %d users processed', len(users))
+            # Skipped conflicts aren't reported by the DB, so don't claim how many were created
+            return ok(
+                "Batch processed; rows clashing with existing usernames/emails were skipped.",
+                data={"submitted": len(users)},
+                http_status=status.HTTP_200_OK
+            )
+        except Exception as e:
+            logger.exception("Failed to process user batch")
+            return fail("Failed to process user batch.", http_status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 @ratelimit_5pm
 class UpdateUserAPI(APIView):
@@ -120,10 +148,10 @@ class UpdateUserAPI(APIView):
             return fail("Invalid data.", errors=serializer.errors, http_status=status.HTTP_400_BAD_REQUEST)
         try:
             serializer.save()
-            logger.info(f"User {request.user.username} updated successfully")
+            logger.info("User %s updated successfully", request.user.username)
             return ok("User updated successfully.", http_status=status.HTTP_200_OK)
         except Exception as e:
-            logger.error(f"Error updating user {request.user.username}: {e}")
+            logger.error("Error updating user %s: %s", request.user.username, e)
             return fail("Failed to update user.", http_status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     def patch(self, request):
@@ -132,10 +160,10 @@ class UpdateUserAPI(APIView):
             return fail("Invalid data.", errors=serializer.errors, http_status=status.HTTP_400_BAD_REQUEST)
         try:
             serializer.save()
-            logger.info(f"User {request.user.username} patched successfully")
+            logger.info("User %s patched successfully", request.user.username)
             return ok("User updated successfully.", http_status=status.HTTP_200_OK)
         except Exception as e:
-            logger.error(f"Error patching user {request.user.username}: {e}")
+            logger.error("Error patching user %s: %s", request.user.username, e)
             return fail("Failed to update user.", http_status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 @ratelimit_5pm
@@ -146,11 +174,16 @@ class DeleteUserAPI(APIView):
         user = request.user
         try:
             username = user.username
-            user.delete()
-            logger.info(f"User {username} deleted.")
-            return ok("User deleted successfully.", http_status=status.HTTP_200_OK)
+            user_id = user.pk
+            # Deactivate and mark with a single UPDATE now; the cascading delete runs in the background
+            User.objects.filter(pk=user_id).update(is_active=False, deletion_requested_at=timezone.now())
+            # update() bypasses the post_save receiver, so drop the cached user here
+            invalidate_cached_user(user_id)
+            delete_user_task(user_id)
+            logger.info("User %s scheduled for deletion.", username)
+            return ok("User deletion scheduled.", http_status=status.HTTP_202_ACCEPTED)
         except Exception as e:
-            logger.error(f"Error deleting user {getattr(user, 'id', 'unknown')}: {e}")
+            logger.error("Error deleting user %s: %s", getattr(user, 'id', 'unknown'), e)
             return fail("Failed to delete user.", http_status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 @ratelimit_5pm
@@ -164,17 +197,17 @@ class RequestTokenAPI(APIView):
 
         # Avoid user enumeration: return 401 for any bad credentials path
         try:
-            username, password = get_user_parameters.get_user_from_serializer(serializer)
-            if not username or not password:
-                return fail("Invalid username or password.", http_status=status.HTTP_401_UNAUTHORIZED)
-
-            user = authenticate(request, username=username, password=password)
+            user = authenticate(
+                request,
+                username=serializer.validated_data["username_or_email"],
+                password=serializer.validated_data["password"],
+            )
             if not user:
                 return fail("Invalid username or password.", http_status=status.HTTP_401_UNAUTHORIZED)
 
             refresh_token = RefreshToken.for_user(user)
             access_token = refresh_token.access_token
-            logger.info(f"Token issued for user {user.username}")
+            logger.info("Token issued for user %s", user.username)
             return ok(
                 "Token issued.",
                 data={"refresh": str(refresh_token), "access": str(access_token)},
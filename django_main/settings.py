@@ -130,9 +130,36 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Login accepts either username or email (one query per attempt)
+AUTHENTICATION_BACKENDS = ["accounts_app.backends.UsernameOrEmailBackend"]
+
+# Argon2id (argon2-cffi) hashes new passwords; the PBKDF2 hashers stay so
+# existing hashes still verify and are upgraded to Argon2 on next login.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+# Threads hashing passwords in parallel during bulk user creation. Each Argon2
+# hash allocates memory_cost = 102400 KiB (~100 MiB) and runs 8 lanes itself,
+# so peak memory is ~100 MiB per worker; os.cpu_count() ignores container limits.
+PASSWORD_HASH_WORKERS = 4
+
+# Backs the authenticated-user cache (helper/user_cache.py). LocMemCache is
+# per process: each uvicorn worker keeps its own copy, and a User change only
+# evicts the entry in the process that made it. Use a shared backend
+# (Redis/Memcached) before running several workers.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "user-cache",
+    }
+}
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts_app.authentication.CachedJWTAuthentication',
     )
 }
 
@@ -1,4 +1,7 @@
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from os import makedirs, path
 from datetime import datetime
 
@@ -17,6 +20,11 @@ def setup_logger(logger_name, level=logging.DEBUG):
         fh = logging.FileHandler(path.join(logs_dir, log_file))
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - [%(module)s] - %(message)s')
         fh.setFormatter(formatter)
-        logger.addHandler(fh)
+        # Callers only enqueue records; the listener thread does the file I/O
+        log_queue = SimpleQueue()
+        listener = QueueListener(log_queue, fh, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(QueueHandler(log_queue))
     return logger
 
@@ -0,0 +1,20 @@
+from django.core.cache import cache
+
+# Seconds an authenticated user stays cached before it is re-read from the DB
+USER_CACHE_TTL = 60
+
+
+def user_cache_key(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def get_cached_user(user_id, loader):
+    """Return the cached user for ``user_id``, calling ``loader()`` on a miss.
+    Note: Whatever loader raises is propagated and nothing is cached.
+    """
+    return cache.get_or_set(user_cache_key(user_id), loader, USER_CACHE_TTL)
+
+
+def invalidate_cached_user(user_id) -> None:
+    """Drop the cached user; call after every update or delete of that user."""
+    cache.delete(user_cache_key(user_id))
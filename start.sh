@@ -1 +1,7 @@
-chmod 755 /app/startapp.sh
\ No newline at end of file
+#!/bin/sh
+set -e
+
+# Finish user deletions that an earlier process accepted (202) but never completed
+python manage.py purge_deleted_users
+
+exec uvicorn django_main.asgi:application --host 0.0.0.0 --port 8000